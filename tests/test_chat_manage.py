@@ -1,7 +1,7 @@
-import time
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -14,34 +14,40 @@ from yaicli.chat import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temp_chat_dir():
-    """Create a temporary directory for chat history files that will be removed after tests."""
-    with TemporaryDirectory() as temp_dir:
+    """Create a temporary directory for chat history files that will be removed after tests.
+
+    Prefer /dev/shm when available so chat files live on a memory-backed
+    filesystem instead of a potentially slow disk.
+    """
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with TemporaryDirectory(dir=base) as temp_dir:
         yield temp_dir
 
 
-@pytest.fixture
-def chat_manager(temp_chat_dir, mock_console):
-    """Create a FileChatManager with a temporary directory for testing."""
-    chat_dir = Path(temp_chat_dir) / "chats"
-    chat_dir.mkdir(parents=True, exist_ok=True)
+@pytest.fixture(scope="module")
+def chat_manager(temp_chat_dir):
+    """Create a FileChatManager with a temporary directory for testing.
 
-    # Create a new manager with isolated configuration
-    manager = FileChatManager()
-    # Use instance attributes instead of class attributes for test isolation
-    manager.chat_dir = chat_dir
-    manager.max_saved_chats = 10
-    # Force-clear the chats map to ensure a clean state
-    manager._chats_map = None
+    Module-scoped so the manager and its temp directory are built once;
+    the autouse `_clean_chat_state` fixture resets state between tests.
+    """
+    # Create a new manager with isolated configuration; passing the values
+    # directly skips the cfg-backed default factories entirely
+    manager = FileChatManager(chat_dir=Path(temp_chat_dir) / "chats", max_saved_chats=10)
 
     yield manager
 
-    # Clean up all files after test
-    for file in chat_dir.glob("*.json"):
+
+@pytest.fixture(autouse=True)
+def _clean_chat_state(chat_manager):
+    """Wipe saved chats and cached state so each test sees a clean manager."""
+    yield
+    for file in chat_manager.chat_dir.glob("*.json"):
         file.unlink(missing_ok=True)
-    # Reset _chats_map to clear state between tests
-    manager._chats_map = None
+    chat_manager._chats_map = None
+    chat_manager.current_chat = None
 
 
 class TestFileChatManager:
@@ -124,18 +130,17 @@ class TestFileChatManager:
 
     def test_list_chats(self, chat_manager):
         """Test listing saved chats."""
-        # Save a few chats
+        # Save a few chats in one batch
         chat1 = Chat(title="Title 1")
         chat1.add_message("user", "Chat 1")
-        chat_manager.save_chat(chat1)
 
         chat2 = Chat(title="Title 2")
         chat2.add_message("user", "Chat 2")
-        chat_manager.save_chat(chat2)
 
         chat3 = Chat(title="Title 3")
         chat3.add_message("user", "Chat 3")
-        chat_manager.save_chat(chat3)
+
+        chat_manager.save_chats([chat1, chat2, chat3])
 
         # List chats
         chats = chat_manager.list_chats()
@@ -149,30 +154,23 @@ class TestFileChatManager:
 
     def test_max_saved_chats(self, temp_chat_dir, mock_console):
         """Test that max_saved_chats is respected."""
-        # Create an isolated test directory
-        test_dir = Path(temp_chat_dir) / "max_saved_test"
-        test_dir.mkdir(parents=True, exist_ok=True)
-
         # Create a dedicated manager for this test with max 2 saved chats
-        manager = FileChatManager()
-        manager.chat_dir = test_dir
-        manager.max_saved_chats = 2
-        manager._chats_map = None
+        # in an isolated directory
+        test_dir = Path(temp_chat_dir) / "max_saved_test"
+        manager = FileChatManager(chat_dir=test_dir, max_saved_chats=2)
 
-        # Save 3 chats
+        # Save 3 chats in one batch; cleanup keeps the newest two, with ties
+        # on mtime broken by the timestamp-and-title filename ordering
         chat1 = Chat(title="Title 1")
         chat1.add_message("user", "Chat 1")
-        manager.save_chat(chat1)
-        time.sleep(0.1)  # Ensure different timestamps
 
         chat2 = Chat(title="Title 2")
         chat2.add_message("user", "Chat 2")
-        manager.save_chat(chat2)
-        time.sleep(0.1)  # Ensure different timestamps
 
         chat3 = Chat(title="Title 3")
         chat3.add_message("user", "Chat 3")
-        manager.save_chat(chat3)
+
+        manager.save_chats([chat1, chat2, chat3])
 
         # Should only keep the 2 most recent
         chats = manager.list_chats()
@@ -331,25 +329,17 @@ class TestFileChatManager:
             assert chat.title == "Nonexistent"
             assert not chat.history
 
-        # Test JSON decode error
+        # Test JSON decode error with a real corrupted file; writing the bad
+        # bytes to disk exercises the actual load path instead of a mock
         test_chat = Chat(title="Test")
         test_chat.add_message("user", "Test")
         chat_manager.save_chat(test_chat)
         chats = chat_manager.list_chats()
         index = chats[0].idx
 
-        with monkeypatch.context() as m:
-
-            def mock_open(*args, **kwargs):
-                mock = MagicMock()
-                mock.__enter__ = lambda self: self
-                mock.__exit__ = lambda self, *args: None
-                mock.read = lambda: "invalid json"
-                return mock
-
-            m.setattr("builtins.open", mock_open)
-            with pytest.raises(ChatLoadError):
-                chat_manager.load_chat_by_index(index)
+        chats[0].path.write_bytes(b"invalid json")
+        with pytest.raises(ChatLoadError):
+            chat_manager.load_chat_by_index(index)
 
     def test_delete_error_handling(self, chat_manager, monkeypatch):
         """Test handling of delete errors."""
@@ -5,51 +5,54 @@ from unittest.mock import MagicMock, patch
 from yaicli.cli import CHAT_MODE, CLI, EXEC_MODE, TEMP_MODE
 from yaicli.config import cfg
 
+# Pre-built stream events in the processed event format; a static tuple is
+# cheaper than rebuilding a generator closure for every test run
+_RESP_HELLO = ("Test response", None)
+_RESP_SHELL = ("ls -la", None)
+_STREAM_EVENTS = (
+    {"type": "content", "chunk": "Hello", "message": None},
+    {"type": "content", "chunk": " World", "message": None},
+    {"type": "finish", "chunk": None, "message": None, "reason": "stop"},
+)
+
+
+def _last_msg_content(mock):
+    """Return the content of the last message passed to a mocked completion call."""
+    return mock.call_args.args[0][-1]["content"]
+
 
 class TestRunSmoke(unittest.TestCase):
     """Smoke tests for yaicli.py"""
 
-    def setUp(self):
-        # Set up environment for tests
+    @classmethod
+    def setUpClass(cls):
+        # Set up environment once for the whole class instead of per test
         os.environ["YAI_API_KEY"] = "test_api_key"
         os.environ["YAI_STREAM"] = "false"  # Disable streaming for easier testing
 
-        # Create CLI instance with test configuration
-        self.cli = CLI(verbose=False)
+        # Create one CLI instance for the class; setUp resets mutable state
+        cls.cli = CLI(verbose=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        # Clean up environment after all tests
+        os.environ.pop("YAI_API_KEY", None)
+        os.environ.pop("YAI_STREAM", None)
 
-        # Mock console AFTER CLI initialization
+    def setUp(self):
+        # Reset the shared CLI's mutable state between tests
         self.cli.console = MagicMock()
         # Ensure the printer instance uses the mocked console as well
         self.cli.printer.console = self.cli.console
-
-    def tearDown(self):
-        # Clean up environment after tests
-        if "YAI_API_KEY" in os.environ:
-            del os.environ["YAI_API_KEY"]
-        if "YAI_STREAM" in os.environ:
-            del os.environ["YAI_STREAM"]
+        self.cli.chat.history.clear()
+        self.cli.current_mode = TEMP_MODE
 
     @patch("openai.OpenAI")
     def test_simple_prompt(self, mock_openai_client):
         """Test basic prompt mode (ai xxx)"""
-        # Mock OpenAI client and response
-        mock_client = MagicMock()
-        mock_openai_client.return_value = mock_client
-
-        # Mock the return value of completions.create method
-        mock_chat_completion = MagicMock()
-        mock_choice = MagicMock()
-        mock_message = MagicMock()
-        mock_message.content = "Test response"
-        mock_choice.message = mock_message
-        mock_chat_completion.choices = [mock_choice]
-
-        # Set up mock objects returned by the API client
-        mock_client.chat.completions.create.return_value = mock_chat_completion
-
         # Directly mock api_client.completion method to return test response
         original_completion = self.cli.client.completion
-        self.cli.client.completion = MagicMock(return_value=("Test response", None))
+        self.cli.client.completion = MagicMock(return_value=_RESP_HELLO)
 
         try:
             # Run CLI with a simple prompt
@@ -68,24 +71,9 @@ class TestRunSmoke(unittest.TestCase):
     @patch("yaicli.cli.CLI._confirm_and_execute", return_value=True)
     def test_shell_mode(self, mock_execute, mock_openai_client):
         """Test shell command mode (ai --shell xxx)"""
-        # Mock OpenAI client and response
-        mock_client = MagicMock()
-        mock_openai_client.return_value = mock_client
-
-        # Mock the return value of completions.create method
-        mock_chat_completion = MagicMock()
-        mock_choice = MagicMock()
-        mock_message = MagicMock()
-        mock_message.content = "ls -la"
-        mock_choice.message = mock_message
-        mock_chat_completion.choices = [mock_choice]
-
-        # Set up mock objects returned by the API client
-        mock_client.chat.completions.create.return_value = mock_chat_completion
-
         # Directly mock api_client.completion method to return test response
         original_completion = self.cli.client.completion
-        self.cli.client.completion = MagicMock(return_value=("ls -la", None))
+        self.cli.client.completion = MagicMock(return_value=_RESP_SHELL)
 
         try:
             # Run CLI in shell mode
@@ -176,14 +164,8 @@ class TestRunSmoke(unittest.TestCase):
         # Enable streaming for this test
         cfg["STREAM"] = True
 
-        # Mock the stream_completion method to yield the processed event format
-        def mock_stream_generator():
-            yield {"type": "content", "chunk": "Hello", "message": None}
-            yield {"type": "content", "chunk": " World", "message": None}
-            yield {"type": "finish", "chunk": None, "message": None, "reason": "stop"}
-
-        # Patch api_client.stream_completion
-        with patch.object(self.cli.client, "stream_completion", return_value=mock_stream_generator()) as mock_stream:
+        # Patch api_client.stream_completion to return the pre-built events
+        with patch.object(self.cli.client, "stream_completion", return_value=_STREAM_EVENTS) as mock_stream:
             # Run CLI with a simple prompt
             try:
                 self.cli.run(chat=False, shell=False, user_input="Hello AI")
@@ -221,8 +203,7 @@ class TestRunSmoke(unittest.TestCase):
 
                 # Verify stream_completion was called
                 mock_stream.assert_called_once()
-                messages_arg = mock_stream.call_args[0][0]
-                self.assertEqual(messages_arg[-1]["content"], "Error Prompt")
+                self.assertEqual(_last_msg_content(mock_stream), "Error Prompt")
 
                 # Verify error message was printed by the exception handler in display_stream
                 error_msg = "An error occurred during stream display: Simulated stream error"
@@ -244,27 +225,25 @@ class TestRunSmoke(unittest.TestCase):
 class TestPromptToolkitIntegration(unittest.TestCase):
     """Tests for prompt_toolkit integration"""
 
-    def setUp(self):
-        # Set up environment for tests
+    @classmethod
+    def setUpClass(cls):
+        # Set up environment once for the whole class instead of per test
         os.environ["YAI_API_KEY"] = "test_api_key"
         os.environ["YAI_STREAM"] = "false"  # Disable streaming for easier testing
 
-    def tearDown(self):
-        # Clean up environment after tests
-        if "YAI_API_KEY" in os.environ:
-            del os.environ["YAI_API_KEY"]
-        if "YAI_STREAM" in os.environ:
-            del os.environ["YAI_STREAM"]
+        # Create one CLI instance for the class
+        cls.cli = CLI(verbose=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        # Clean up environment after all tests
+        os.environ.pop("YAI_API_KEY", None)
+        os.environ.pop("YAI_STREAM", None)
 
     @patch("openai.OpenAI")
     def test_prompt_toolkit_input(self, mock_openai_client):
         """Test prompt_toolkit input handling"""
-        # Mock OpenAI client
-        mock_client = MagicMock()
-        mock_openai_client.return_value = mock_client
-
-        # Create CLI instance
-        cli = CLI(verbose=False)
+        cli = self.cli
         cli.console = MagicMock()
 
         # Directly mock _process_user_input instead of modifying api_client underlying implementation
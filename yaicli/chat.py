@@ -1,10 +1,11 @@
 import json
 import os
+import re
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from rich.table import Table
 
@@ -14,8 +15,17 @@ from .exceptions import ChatDeleteError, ChatLoadError, ChatSaveError
 from .schemas import ChatMessage
 from .utils import option_callback
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; stdlib json is used when unavailable
+    orjson = None
+
 console: YaiConsole = get_console()
 
+# Chat filename format, e.g. "20250421-214005-title-meaning of life"
+_FILENAME_RE = re.compile(r"^(\d{8})-(\d{6})-title-(.+)$")
+
 
 @dataclass
 class Chat:
@@ -64,15 +74,13 @@ class Chat:
             return False
 
         try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.title = data.get("title", self.title)
-                self.date = data.get("date", self.date)
-                self.history = [
-                    ChatMessage(role=msg["role"], content=msg["content"]) for msg in data.get("history", [])
-                ]
+            raw = self.path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self.title = data.get("title", self.title)
+            self.date = data.get("date", self.date)
+            self.history = [ChatMessage(role=msg["role"], content=msg["content"]) for msg in data.get("history", [])]
             return True
-        except (json.JSONDecodeError, OSError) as e:
+        except (ValueError, OSError) as e:
             raise ChatLoadError(f"Error loading chat: {e}") from e
 
     def save(self, chat_dir: Path) -> bool:
@@ -104,9 +112,13 @@ class Chat:
         chat_path = chat_dir / filename
 
         try:
-            # Save the chat as JSON
-            with open(chat_path, "w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            # Save the chat as compact JSON, using orjson when available for
+            # speed; skipping indentation keeps files smaller and parses faster
+            if orjson is not None:
+                chat_path.write_bytes(orjson.dumps(self.to_dict()))
+            else:
+                with open(chat_path, "w", encoding="utf-8") as f:
+                    json.dump(self.to_dict(), f, separators=(",", ":"), ensure_ascii=False)
 
             # Update chat's path to the new file
             self.path = chat_path
@@ -124,6 +136,10 @@ class FileChatManager:
     max_saved_chats: int = field(default_factory=lambda: cfg["MAX_SAVED_CHATS"])
     current_chat: Optional[Chat] = None
     _chats_map: Optional[Dict[str, Dict[str, Chat]]] = None
+    # Parsed filename cache keyed by path, invalidated per-file on mtime change
+    _parse_cache: Dict[Path, Tuple[float, Chat]] = field(default_factory=dict)
+    # Directory mtime recorded at the last scan, used to spot external changes
+    _chats_map_mtime_ns: int = -1
 
     def __post_init__(self) -> None:
         if not isinstance(self.chat_dir, Path):
@@ -133,20 +149,37 @@ class FileChatManager:
 
     @property
     def chats_map(self) -> Dict[str, Dict[str, Chat]]:
-        """Get the map of chats, loading from disk only when needed"""
-        if self._chats_map is None:
+        """Get the map of chats, rescanning disk only when needed
+
+        The map is rebuilt when it was explicitly invalidated (set to None
+        by save/delete/refresh) or when the chat directory's mtime shows the
+        files changed behind our back; otherwise repeated accesses are O(1).
+        """
+        try:
+            dir_mtime_ns = self.chat_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime_ns = -1
+        if self._chats_map is None or dir_mtime_ns != self._chats_map_mtime_ns:
             self._load_chats()
+            self._chats_map_mtime_ns = dir_mtime_ns
         return self._chats_map or {"index": {}, "title": {}}
 
     def _load_chats(self) -> None:
         """Load chats from disk into memory"""
-        chat_files = sorted(list(self.chat_dir.glob("*.json")), key=lambda f: f.stat().st_mtime, reverse=True)
+        chat_files = sorted(((f.stat().st_mtime, f) for f in self.chat_dir.glob("*.json")), reverse=True)
         chats_map = {"title": {}, "index": {}}
+        parse_cache = {}
 
-        for i, chat_file in enumerate(chat_files[: self.max_saved_chats]):
+        for i, (mtime, chat_file) in enumerate(chat_files[: self.max_saved_chats]):
             try:
-                # Parse basic chat info from filename
-                chat = self._parse_filename(chat_file)
+                # Parse basic chat info from filename, reusing the cached
+                # result when the file hasn't changed since the last scan
+                cached = self._parse_cache.get(chat_file)
+                if cached is not None and cached[0] == mtime:
+                    chat = cached[1]
+                else:
+                    chat = self._parse_filename(chat_file)
+                parse_cache[chat_file] = (mtime, chat)
                 chat.idx = str(i + 1)
 
                 # Add to maps
@@ -156,6 +189,7 @@ class FileChatManager:
                 # Log the error but continue processing other files
                 raise ChatLoadError(f"Error parsing session file {chat_file}: {e}") from e
 
+        self._parse_cache = parse_cache
         self._chats_map = chats_map
 
     def new_chat(self, title: str = "") -> Chat:
@@ -205,6 +239,36 @@ class FileChatManager:
 
         return chat.title
 
+    def save_chats(self, chats: Iterable[Chat]) -> List[str]:
+        """Save multiple chat sessions in one batch
+
+        Each chat is written the same way as save_chat, but the old-chat
+        cleanup and the chats-map invalidation run once at the end instead
+        of once per chat.
+
+        Args:
+            chats (Iterable[Chat]): The chats to save.
+
+        Returns:
+            List[str]: The titles of the saved chats.
+
+        Raises:
+            ChatSaveError: If there's an error saving any chat
+        """
+        titles = []
+        for chat in chats:
+            # Check for existing chat with the same title and delete it
+            if chat.title:
+                self._delete_existing_chat_with_title(chat.title)
+            chat.save(self.chat_dir)
+            titles.append(chat.title)
+
+        # Clean up old chats and refresh the map once for the whole batch
+        self._cleanup_old_chats()
+        self._chats_map = None
+
+        return titles
+
     def _delete_existing_chat_with_title(self, title: str) -> None:
         """Delete any existing chat with the given title"""
         if not title:
@@ -363,32 +427,16 @@ class FileChatManager:
     @staticmethod
     def _parse_filename(chat_file: Path) -> Chat:
         """Parse a chat filename and extract metadata"""
-        # filename: "20250421-214005-title-meaning of life"
-        filename = chat_file.stem
-        parts = filename.split("-")
-        title_str_len = 6  # "title-" marker length
-
-        # Check if the filename has the expected format
-        if len(parts) >= 4 and "title" in parts:
-            str_title_index = filename.find("title")
-            if str_title_index == -1:
-                # If "title" is not found, use full filename as the title
-                # Just in case, fallback to use fullname, but this should never happen when `len(parts) >= 4 and "title" in parts`
-                str_title_index = 0
-                title_str_len = 0
-
-            # "20250421-214005-title-meaning of life" ==> "meaning of life"
-            title = filename[str_title_index + title_str_len :]
-            date_ = parts[0]
-            time_ = parts[1]
+        # "20250421-214005-title-meaning of life" ==> date/time + "meaning of life"
+        match = _FILENAME_RE.match(chat_file.stem)
+        if match:
+            date_, time_, title = match.groups()
             # Format date
             date_str = f"{date_[:4]}-{date_[4:6]}-{date_[6:]} {time_[:2]}:{time_[2:4]}"
-
         else:
             # Fallback for files that don't match expected format
-            title = filename
+            title = chat_file.stem
             date_str = ""
-            # timestamp = 0
 
         # Create a minimal Chat object with the parsed info
         return Chat(title=title, date=date_str, path=chat_file)
@@ -4,7 +4,7 @@ import time
 import traceback
 from os import devnull
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 import typer
 from prompt_toolkit import PromptSession, prompt
@@ -70,8 +70,22 @@ class CLI:
 
         self.bindings = KeyBindings()
 
+        # Exact-match special commands (lowered input -> handler)
+        self._special_commands = {
+            CMD_EXIT: self._cmd_exit,
+            CMD_CLEAR: self._cmd_clear,
+            CMD_HISTORY: self._cmd_history,
+            CMD_LIST_CHATS: self._cmd_list_chats,
+        }
+        for cmd in CMD_HELP:
+            self._special_commands[cmd] = self._cmd_help
+
         self.current_mode: str = TEMP_MODE
 
+        # System messages composed per role; the prompt is fixed once a role
+        # is loaded, so each role's message only needs to be built once
+        self._system_message_cache: Dict[str, ChatMessage] = {}
+
         self.interactive_round = cfg["INTERACTIVE_ROUND"]
         self.chat_start_time = None
         self.is_temp_session = True
@@ -121,6 +135,12 @@ class CLI:
             self.printer = Printer(content_markdown=False)
         elif role_name == DefaultRoleNames.SHELL:
             self.current_mode = EXEC_MODE
+            # Shell output is a command that gets fence-stripped and shown in a
+            # panel anyway, so skip Markdown rendering entirely
+            self.printer = Printer(content_markdown=False)
+        elif not self.printer.content_markdown:
+            # Restore Markdown rendering when switching back from coder/shell
+            self.printer = Printer()
 
     @classmethod
     def evaluate_role_name(cls, code: bool = False, shell: bool = False, role: str = ""):
@@ -144,8 +164,11 @@ class CLI:
     def _check_history_len(self) -> None:
         """Check history length and remove the oldest messages if necessary"""
         target_len = self.interactive_round * 2
-        if len(self.chat.history) > target_len:
-            self.chat.history = self.chat.history[-target_len:]
+        excess = len(self.chat.history) - target_len
+        if excess > 0:
+            # Trim in place so the Chat keeps its history list object instead
+            # of allocating a fresh copy every time the cap is exceeded
+            del self.chat.history[:excess]
             if self.verbose:
                 self.console.print(f"Dialogue trimmed to {target_len} messages.", style="dim")
 
@@ -240,37 +263,53 @@ class CLI:
             return False
 
     # ------------------- Special commands -------------------
+    def _cmd_help(self, user_input: str) -> bool:
+        """Handle help command, case-insensitive"""
+        self.print_help()
+        return True
+
+    def _cmd_exit(self, user_input: str) -> bool:
+        """Handle exit command, case-insensitive"""
+        return False
+
+    def _cmd_clear(self, user_input: str) -> Union[bool, str]:
+        """Handle clear command, case-insensitive; only special in chat mode"""
+        if self.current_mode != CHAT_MODE:
+            return user_input
+        self.chat.history.clear()
+        self.console.print("Chat history cleared", style="bold yellow")
+        return True
+
+    def _cmd_history(self, user_input: str) -> bool:
+        """Handle history command, case-insensitive"""
+        if not self.chat.history:
+            self.console.print("History is empty.", style="yellow")
+        else:
+            self.console.print("Chat History:", style="bold underline")
+            for i in range(0, len(self.chat.history), 2):
+                user_msg = self.chat.history[i]
+                assistant_msg = self.chat.history[i + 1] if (i + 1) < len(self.chat.history) else None
+                self.console.print(f"[dim]{i // 2 + 1}[/dim] [bold blue]User:[/bold blue] {user_msg.content}")
+                if assistant_msg:
+                    md = Markdown(assistant_msg.content, code_theme=cfg["CODE_THEME"])
+                    padded_md = Padding(md, (0, 0, 0, 4))
+                    self.console.print("    Assistant:", style="bold green")
+                    self.console.print(padded_md)
+        return True
+
+    def _cmd_list_chats(self, user_input: str) -> bool:
+        """Handle list command, case-insensitive"""
+        self._list_chats()
+        return True
+
     def _handle_special_commands(self, user_input: str) -> Union[bool, str]:
         """Handle special command return: True-continue loop, False-exit loop, str-non-special command"""
         lower_input = user_input.lower().strip()
-        if lower_input in CMD_HELP:
-            # case-insensitive
-            self.print_help()
-            return True
-        if lower_input == CMD_EXIT:
-            # case-insensitive
-            return False
-        if lower_input == CMD_CLEAR and self.current_mode == CHAT_MODE:
-            # case-insensitive
-            self.chat.history.clear()
-            self.console.print("Chat history cleared", style="bold yellow")
-            return True
-        if lower_input == CMD_HISTORY:
-            # case-insensitive
-            if not self.chat.history:
-                self.console.print("History is empty.", style="yellow")
-            else:
-                self.console.print("Chat History:", style="bold underline")
-                for i in range(0, len(self.chat.history), 2):
-                    user_msg = self.chat.history[i]
-                    assistant_msg = self.chat.history[i + 1] if (i + 1) < len(self.chat.history) else None
-                    self.console.print(f"[dim]{i // 2 + 1}[/dim] [bold blue]User:[/bold blue] {user_msg.content}")
-                    if assistant_msg:
-                        md = Markdown(assistant_msg.content, code_theme=cfg["CODE_THEME"])
-                        padded_md = Padding(md, (0, 0, 0, 4))
-                        self.console.print("    Assistant:", style="bold green")
-                        self.console.print(padded_md)
-            return True
+
+        # Exact-match commands dispatch in one dict lookup
+        handler = self._special_commands.get(lower_input)
+        if handler is not None:
+            return handler(user_input)
 
         # Handle /save command - optional title parameter
         if lower_input.startswith(CMD_SAVE_CHAT):
@@ -303,12 +342,6 @@ class CLI:
                 self._list_chats()
             return True
 
-        # Handle /list command to list saved chats
-        if lower_input == CMD_LIST_CHATS:
-            # case-insensitive
-            self._list_chats()
-            return True
-
         # Handle /mode command
         if lower_input.startswith(CMD_MODE):
             # Switch mode by lower user input, case-insensitive
@@ -327,8 +360,13 @@ class CLI:
 
     def _build_messages(self, user_input: str) -> list[ChatMessage]:
         """Build message list for LLM API"""
-        # Create the message list with system prompt
-        messages = [ChatMessage(role="system", content=self.role.prompt)]
+        # Create the message list with system prompt, reusing the composed
+        # message for the active role
+        system_msg = self._system_message_cache.get(self.role_name)
+        if system_msg is None:
+            system_msg = ChatMessage(role="system", content=self.role.prompt)
+            self._system_message_cache[self.role_name] = system_msg
+        messages = [system_msg]
 
         # Add previous conversation if available
         for msg in self.chat.history:
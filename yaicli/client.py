@@ -1,14 +1,17 @@
 import json
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, List, Optional, Union, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Union, cast
 
-import litellm
 from json_repair import repair_json
-from litellm.types.utils import Choices
-from litellm.types.utils import Message as ChoiceMessage
-from litellm.types.utils import ModelResponse
 from rich.panel import Panel
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; stdlib json is used when unavailable
+    orjson = None
+
 from .config import cfg
 from .console import get_console
 from .schemas import ChatMessage, LLMResponse, ToolCall
@@ -20,9 +23,24 @@ from .tools import (
     list_functions,
 )
 
-litellm.drop_params = True
+if TYPE_CHECKING:
+    import litellm
+    from litellm.types.utils import Choices, ModelResponse
+
 console = get_console()
 
+# Sentinel distinguishing "attribute missing" from an attribute set to None
+_MISSING = object()
+
+
+@lru_cache(maxsize=1)
+def _get_litellm():
+    """Import litellm on first use; it is heavy and only needed for API calls"""
+    import litellm
+
+    litellm.drop_params = True
+    return litellm
+
 
 class RefreshLive:
     """Refresh live display"""
@@ -48,6 +66,29 @@ class LitellmClient:
         self.pre_tool_call_id = None
         if cfg["PROVIDER"] == "openrouter":
             cfg["EXTRA_HEADERS"].update({"X-Title": "Yaicli", "HTTP-Referer": "https://github.com/belingud/yaicli"})
+        # Snapshot request parameters once; these config values are fixed after
+        # startup (ENABLE_FUNCTIONS can still be toggled per role, so it is
+        # read from cfg at request time)
+        self.provider = cfg["PROVIDER"]
+        self.temperature = cfg["TEMPERATURE"]
+        self.top_p = cfg["TOP_P"]
+        self.max_tokens = cfg["MAX_TOKENS"]
+        self.reasoning_effort = cfg["REASONING_EFFORT"]
+        self.extra_headers = cfg["EXTRA_HEADERS"]
+        self.extra_body = cfg["EXTRA_BODY"]
+        # Fixed request parameters; per-request params are built by copying
+        # this template and filling in messages/stream
+        self._params_template: Dict[str, Any] = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            # Openai: max_tokens is now deprecated in favor of max_completion_tokens.
+            "max_tokens": self.max_tokens,
+            "max_completion_tokens": self.max_tokens,
+            # litellm api params
+            "api_key": self.api_key,
+            "base_url": self.base_url,
+        }
 
     def _convert_messages(self, messages: List[ChatMessage]) -> List[Dict[str, Any]]:
         """Convert message format to OpenAI API required format"""
@@ -121,37 +162,28 @@ class LitellmClient:
         openai_messages = self._convert_messages(messages)
 
         # Prepare request parameters
-        params: Dict[str, Any] = {
-            "model": self.model,
-            "messages": openai_messages,
-            "temperature": cfg["TEMPERATURE"],
-            "top_p": cfg["TOP_P"],
-            "stream": stream,
-            # Openai: This value is now deprecated in favor of max_completion_tokens.
-            "max_tokens": cfg["MAX_TOKENS"],
-            "max_completion_tokens": cfg["MAX_TOKENS"],
-            # litellm api params
-            "api_key": self.api_key,
-            "base_url": self.base_url,
-            "reasoning_effort": cfg["REASONING_EFFORT"],
-        }
+        params: Dict[str, Any] = dict(self._params_template)
+        params["messages"] = openai_messages
+        params["stream"] = stream
+        params["reasoning_effort"] = self.reasoning_effort
 
         # Add optional parameters
-        if cfg["EXTRA_HEADERS"]:
-            params["extra_headers"] = cfg["EXTRA_HEADERS"]
-        if cfg["EXTRA_BODY"]:
-            params["extra_body"] = cfg["EXTRA_BODY"]
+        if self.extra_headers:
+            params["extra_headers"] = self.extra_headers
+        if self.extra_body:
+            params["extra_body"] = self.extra_body
         if cfg["ENABLE_FUNCTIONS"]:
             params["tools"] = self._convert_functions(list_functions())
             params["tool_choice"] = "auto"
             params["parallel_tool_calls"] = False
         # Send request
+        litellm = _get_litellm()
         response = litellm.completion(**params)
         if stream:
-            response = cast(litellm.CustomStreamWrapper, response)
+            response = cast("litellm.CustomStreamWrapper", response)
             llm_content_generator = self._handle_stream_response(response)
         else:
-            response = cast(ModelResponse, response)
+            response = cast("ModelResponse", response)
             llm_content_generator = self._handle_normal_response(response)
         for llm_content in llm_content_generator:
             yield llm_content
@@ -169,7 +201,7 @@ class LitellmClient:
                 # add function call result
                 messages.append(
                     ChatMessage(
-                        role=self.detect_tool_role(cfg["PROVIDER"]),
+                        role=self.detect_tool_role(self.provider),
                         content=function_result,
                         name=llm_content.tool_call.name,
                         tool_call_id=llm_content.tool_call.id,
@@ -189,19 +221,9 @@ class LitellmClient:
 
     def stream_completion(self, messages: List[ChatMessage], stream: bool = True) -> Generator[LLMResponse, None, None]:
         openai_messages = self._convert_messages(messages)
-        params: Dict[str, Any] = {
-            "model": self.model,
-            "messages": openai_messages,
-            "temperature": cfg["TEMPERATURE"],
-            "top_p": cfg["TOP_P"],
-            "stream": stream,
-            # Openai: This value is now deprecated in favor of max_completion_tokens.
-            "max_tokens": cfg["MAX_TOKENS"],
-            "max_completion_tokens": cfg["MAX_TOKENS"],
-            # litellm api params
-            "api_key": self.api_key,
-            "base_url": self.base_url,
-        }
+        params: Dict[str, Any] = dict(self._params_template)
+        params["messages"] = openai_messages
+        params["stream"] = stream
         # Add optional parameters
         if cfg["ENABLE_FUNCTIONS"]:
             params["tools"] = self._convert_functions(list_functions())
@@ -209,8 +231,9 @@ class LitellmClient:
             params["parallel_tool_calls"] = False
 
         # Send request
+        litellm = _get_litellm()
         response = litellm.completion(**params)
-        response = cast(litellm.CustomStreamWrapper, response)
+        response = cast("litellm.CustomStreamWrapper", response)
         llm_content_generator = self._handle_stream_response(response)
         for llm_content in llm_content_generator:
             yield llm_content
@@ -226,7 +249,7 @@ class LitellmClient:
                 # add function call result
                 messages.append(
                     ChatMessage(
-                        role=self.detect_tool_role(cfg["PROVIDER"]),
+                        role=self.detect_tool_role(self.provider),
                         content=function_result,
                         name=llm_content.tool_call.name,
                         tool_call_id=llm_content.tool_call.id,
@@ -235,7 +258,7 @@ class LitellmClient:
 
                 yield from self.stream_completion(messages)
 
-    def _handle_normal_response(self, response: ModelResponse) -> Generator[LLMResponse, None, None]:
+    def _handle_normal_response(self, response: "ModelResponse") -> Generator[LLMResponse, None, None]:
         """Handle normal (non-streaming) response
 
         Returns:
@@ -281,7 +304,7 @@ class LitellmClient:
 
         yield LLMResponse(reasoning=reasoning, content=content, finish_reason=finish_reason, tool_call=tool_call)
 
-    def _handle_stream_response(self, response: litellm.CustomStreamWrapper) -> Generator[LLMResponse, None, None]:
+    def _handle_stream_response(self, response: "litellm.CustomStreamWrapper") -> Generator[LLMResponse, None, None]:
         """Handle streaming response
 
         Returns:
@@ -289,8 +312,9 @@ class LitellmClient:
             - reasoning: The thinking/reasoning content (if any)
             - content: The normal response content
         """
-        full_reasoning = ""
-        full_content = ""
+        # Accumulate content in a list buffer; joining on demand keeps growth
+        # linear instead of copying the whole string every chunk
+        content_parts: List[str] = []
         content = ""
         reasoning = ""
         tool_id = ""
@@ -305,17 +329,14 @@ class LitellmClient:
 
             # Concat content
             content = delta.content or ""
-            full_content += content
+            content_parts.append(content)
 
-            # Concat reasoning
             reasoning = self._get_reasoning_content(delta)
-            full_reasoning += reasoning or ""
 
-            if finish_reason:
-                pass
             if finish_reason == "tool_calls" or ('{"index":' in content or '"tool_calls":' in content):
                 # Tool call data may in content after the <think> block
                 # >/n{"index": 0, "tool_call_id": "call_1", "function": {"name": "name", "arguments": "{}"}, "output": null}
+                full_content = "".join(content_parts)
                 tool_index = full_content.find('{"index":')
                 if tool_index != -1:
                     tmp_content = full_content[tool_index:]
@@ -352,14 +373,16 @@ class LitellmClient:
         # reasoning_content: deepseek/infi-ai
         # reasoning: openrouter
         # <think> block implementation not in here
+        missing = _MISSING
         for key in ("reasoning_content", "reasoning"):
-            # Check if the key exists and its value is a non-empty string
-            if hasattr(delta, key):
-                return getattr(delta, key)
+            # Single lookup per key; runs once per streamed chunk
+            value = getattr(delta, key, missing)
+            if value is not missing:
+                return value
 
         return None  # Return None if no relevant key with a string value is found
 
-    def parse_choice_from_content(self, content: str) -> Choices:
+    def parse_choice_from_content(self, content: str) -> "Choices":
         """
         Parse the choice from the content after <think>...</think> block.
         Args:
@@ -369,9 +392,13 @@ class LitellmClient:
             The choice object
         Raises ValueError if the content is not valid JSON
         """
+        from litellm.types.utils import Choices
+        from litellm.types.utils import Message as ChoiceMessage
+
         try:
-            content_dict = json.loads(content)
-        except json.JSONDecodeError:
+            # orjson parses small payloads several times faster than stdlib json
+            content_dict = orjson.loads(content) if orjson is not None else json.loads(content)
+        except ValueError:
             raise ValueError(f"Invalid message from LLM: {content}")
         if "delta" in content_dict:
             try:
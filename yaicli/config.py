@@ -3,6 +3,7 @@ import json
 from dataclasses import dataclass
 from functools import lru_cache
 from os import getenv
+from types import MappingProxyType
 from typing import Optional
 
 from rich import get_console
@@ -18,6 +19,11 @@ from .const import (
 )
 from .utils import str2bool
 
+# Derived views of DEFAULT_CONFIG_MAP computed once at import time so reload
+# does not rebuild them on every call
+_DEFAULT_VALUES = MappingProxyType({k: v["value"] for k, v in DEFAULT_CONFIG_MAP.items()})
+_ENV_KEYS = tuple((k, v["env_key"]) for k, v in DEFAULT_CONFIG_MAP.items())
+
 
 class CasePreservingConfigParser(configparser.RawConfigParser):
     """Case preserving config parser"""
@@ -73,16 +79,14 @@ class Config(dict):
 
     def _load_defaults(self) -> None:
         """Load default configuration values as strings."""
-        defaults = {k: v["value"] for k, v in DEFAULT_CONFIG_MAP.items()}
-        self.update(defaults)
+        self.update(_DEFAULT_VALUES)
 
-    def _ensure_version_updated_config_keys(self) -> None:
+    def _ensure_version_updated_config_keys(self, config_content: str) -> None:
         """Ensure configuration keys added in version updates exist in the config file.
         Appends missing keys to the config file if they don't exist.
         """
-        with open(CONFIG_PATH, "r+", encoding="utf-8") as f:
-            config_content = f.read()
-            if "CHAT_HISTORY_DIR" not in config_content.strip():  # Check for empty lines
+        if "CHAT_HISTORY_DIR" not in config_content.strip():  # Check for empty lines
+            with open(CONFIG_PATH, "a", encoding="utf-8") as f:
                 f.write(f"\nCHAT_HISTORY_DIR={DEFAULT_CHAT_HISTORY_DIR}\n")
 
     def _load_from_file(self) -> None:
@@ -90,15 +94,29 @@ class Config(dict):
 
         Creates default config file if it doesn't exist.
         """
-        if not CONFIG_PATH.exists():
+        # Read in one step instead of exists() + read(); also atomic with
+        # respect to the file disappearing between check and read
+        try:
+            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                config_content = f.read()
+        except FileNotFoundError:
             self.console.print("Creating default configuration file.", style="bold yellow", justify=self["JUSTIFY"])
             CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
             with open(CONFIG_PATH, "w", encoding="utf-8") as f:
                 f.write(DEFAULT_CONFIG_INI)
             return
+        except OSError as e:
+            # e.g. permission denied or CONFIG_PATH is a directory; fall back
+            # to defaults instead of crashing at import time
+            self.console.print(
+                f"[yellow]Warning:[/] Could not read config file '{CONFIG_PATH}': {e}. Using default configuration.",
+                style="dim",
+                justify=self["JUSTIFY"],
+            )
+            return
 
         config_parser = CasePreservingConfigParser()
-        config_parser.read(CONFIG_PATH, encoding="utf-8")
+        config_parser.read_string(config_content)
 
         # Check if "core" section exists in the config file
         if "core" not in config_parser or not config_parser["core"]:
@@ -111,15 +129,16 @@ class Config(dict):
         self.update(dict(config_parser["core"]))
 
         # Check if keys added in version updates are missing and add them
-        self._ensure_version_updated_config_keys()
+        self._ensure_version_updated_config_keys(config_content)
 
     def _load_from_env(self) -> None:
         """Load configuration from environment variables.
 
         Updates the configuration dictionary in-place.
         """
-        for key, config_info in DEFAULT_CONFIG_MAP.items():
-            env_value = getenv(config_info["env_key"])
+        env_get = getenv
+        for key, env_key in _ENV_KEYS:
+            env_value = env_get(env_key)
             if env_value is not None:
                 self[key] = env_value
 
@@ -129,7 +148,7 @@ class Config(dict):
         Updates the configuration dictionary in-place with properly typed values.
         Falls back to default values if conversion fails.
         """
-        default_values_map = {k: v["value"] for k, v in DEFAULT_CONFIG_MAP.items()}
+        default_values_map = _DEFAULT_VALUES
 
         for key, config_info in DEFAULT_CONFIG_MAP.items():
             target_type = config_info["type"]
@@ -22,7 +22,8 @@ class Printer:
     content_markdown: bool = True
 
     _REASONING_PREFIX: str = "> "
-    _UPDATE_INTERVAL: float = 0.01
+    # Minimum seconds between display re-renders while streaming
+    _UPDATE_INTERVAL: float = 0.04
 
     def __post_init__(self):
         self.code_theme: str = self.config["CODE_THEME"]
@@ -30,6 +31,8 @@ class Printer:
         # Set formatter for reasoning and content
         self.reasoning_formatter = Markdown
         self.content_formatter = Markdown if self.content_markdown else plain_formatter
+        # Streaming renders use plain text; Markdown is applied once at the end
+        self.stream_formatter = plain_formatter
         # Track if we're currently processing reasoning content
         self.in_reasoning: bool = False
 
@@ -107,16 +110,22 @@ class Printer:
         # Check for any <think> tags in the updated content/reasoning
         return self._check_and_update_think_tags(content, reasoning)
 
-    def _format_display_text(self, content: str, reasoning: str) -> RenderableType:
+    def _format_display_text(self, content: str, reasoning: str, final: bool = True) -> RenderableType:
         """Format the text for display, combining content and reasoning if needed.
 
         Args:
             content: The content text.
             reasoning: The reasoning text.
+            final: Whether this is the final render. Intermediate stream
+                renders use the plain formatter to avoid re-parsing the whole
+                buffer as Markdown on every update.
 
         Returns:
             The formatted text ready for display as a Rich renderable.
         """
+        reasoning_formatter = self.reasoning_formatter if final else self.stream_formatter
+        content_formatter = self.content_formatter if final else self.stream_formatter
+
         # Create list of display elements to avoid type issues with concatenation
         display_elements: List[RenderableType] = []
 
@@ -128,12 +137,12 @@ class Printer:
 
             # Format the reasoning section
             reasoning_header = "\nThinking:\n"
-            formatted_reasoning = self.reasoning_formatter(reasoning_header + raw_reasoning, code_theme=self.code_theme)
+            formatted_reasoning = reasoning_formatter(reasoning_header + raw_reasoning, code_theme=self.code_theme)
             display_elements.append(formatted_reasoning)
 
         # Format content if it exists
         if content:
-            formatted_content = self.content_formatter(content, code_theme=self.code_theme)
+            formatted_content = content_formatter(content, code_theme=self.code_theme)
 
             # Add spacing between reasoning and content if both exist
             if reasoning and self.show_reasoning:
@@ -186,10 +195,12 @@ class Printer:
         full_content = full_reasoning = ""
         live = Live(console=self.console)
         live.start()
+        last_render = 0.0
 
         for chunk in stream_iterator:
             if isinstance(chunk, RefreshLive):
                 # Refresh live display when in next completion
+                live.update(self._format_display_text(full_content, full_reasoning))
                 live.stop()
                 messages.append(ChatMessage(role="assistant", content=full_content))
                 live = Live(console=self.console)
@@ -197,6 +208,7 @@ class Printer:
                 # Initialize full_content and full_reasoning for the next completion
                 full_content = full_reasoning = ""
                 self._reset_state()
+                last_render = 0.0
                 continue
 
             # Process chunk and update content/reasoning
@@ -204,11 +216,16 @@ class Printer:
                 chunk.content or "", chunk.reasoning or "", full_content, full_reasoning
             )
 
-            # Update display
-            formatted_display = self._format_display_text(full_content, full_reasoning)
-            live.update(formatted_display)
-            time.sleep(self._UPDATE_INTERVAL)
+            # Re-rendering the whole accumulated buffer per chunk is O(N^2)
+            # over a stream, so coalesce updates: render when enough time has
+            # passed or the chunk adds a line break
+            now = time.monotonic()
+            if now - last_render >= self._UPDATE_INTERVAL or "\n" in (chunk.content or ""):
+                live.update(self._format_display_text(full_content, full_reasoning, final=False))
+                last_render = now
 
+        # Make sure the last chunks are on screen before stopping
+        live.update(self._format_display_text(full_content, full_reasoning))
         live.stop()
         messages.append(ChatMessage(role="assistant", content=full_content))
         return full_content, full_reasoning
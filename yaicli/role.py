@@ -1,5 +1,6 @@
 import json
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, TypeVar
 
@@ -14,6 +15,12 @@ from .utils import detect_os, detect_shell, option_callback
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=1)
+def _detect_system_vars() -> Dict[str, str]:
+    """Detect OS and shell once; they cannot change during a process lifetime"""
+    return {"_os": detect_os(cfg), "_shell": detect_shell(cfg)}
+
+
 @dataclass
 class Role:
     name: str
@@ -28,7 +35,7 @@ class Role:
             raise ValueError("Role must have a non-empty description")
 
         if not self.variables:
-            self.variables = {"_os": detect_os(cfg), "_shell": detect_shell(cfg)}
+            self.variables = dict(_detect_system_vars())
         self.prompt = self.prompt.format(**self.variables)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -1,4 +1,5 @@
 import platform
+import re
 from os import getenv
 from os.path import basename, pathsep
 from typing import Any, Callable, Optional, TypeVar
@@ -10,6 +11,10 @@ from .const import DEFAULT_OS_NAME, DEFAULT_SHELL_NAME
 
 T = TypeVar("T", int, float, str, bool)
 
+# Fenced code block with an optional language specifier and a closing fence,
+# e.g. ```bash\nls -la\n``` — the body is captured in one match
+_CODE_BLOCK_RE = re.compile(r"^```[^\n]*\n(.*?)\n?\s*```\s*$", re.DOTALL)
+
 
 def option_callback(func: Callable) -> Callable:  # pragma: no cover
     """
@@ -87,14 +92,21 @@ def filter_command(command: str) -> Optional[str]:
     if "```" not in command:
         return command.strip()
 
+    command = command.strip()
+
+    # Well-formed multi-line code block: capture the body in a single match
+    match = _CODE_BLOCK_RE.match(command)
+    if match:
+        return "\n".join(line.strip() for line in match.group(1).split("\n") if line.strip())
+
     # Handle code blocks with or without language specifiers
-    lines = command.strip().split("\n")
+    lines = command.split("\n")
 
     # Check if it's a single-line code block like ```ls -al```
     if len(lines) == 1 and lines[0].startswith("```") and lines[0].endswith("```"):
         return lines[0][3:-3].strip()
 
-    # Handle multi-line code blocks
+    # Handle multi-line code blocks (typically without a closing fence)
     if lines[0].startswith("```"):
         # Remove the opening ``` line (with or without language specifier)
         content_lines = lines[1:]
@@ -107,7 +119,7 @@ def filter_command(command: str) -> Optional[str]:
         return "\n".join(line.strip() for line in content_lines if line.strip())
     else:
         # If the first line doesn't start with ```, return the entire command without the ``` characters
-        return command.strip().replace("```", "")
+        return command.replace("```", "")
 
 
 def str2bool(value: Any) -> bool: